@@ -4,6 +4,7 @@ type, it will walk over the Method Resolution Order (MRO) looking for a value.
 """
 
 from collections.abc import Iterable
+from itertools import chain
 
 __all__ = [
     "concat_map",
@@ -13,20 +14,35 @@ __all__ = [
     "FallbackInheritanceDict",
     "TypeConvertingInheritanceDict",
     "FallbackTypeConvertingInheritanceDict",
+    "FrozenInheritanceDict",
 ]
 MISSING = object()
+UNCACHED = object()
 
 
 def concat_map(func, items):
     """
-    Yield items from the iterables produced by applying func to each element of items.
+    Return an iterator over the items from the iterables produced by applying func to each
+    element of items.
 
     func should be a callable that accepts a single item and returns an iterable; concat_map
     lazily iterates over items, calls func(item) for each, and yields each element from the
-    resulting iterable in order.
+    resulting iterable in order. This is done with `map` and `chain.from_iterable`, which are
+    implemented in C, and thus do not create a generator frame per item.
     """
-    for item in items:
-        yield from func(item)
+    return chain.from_iterable(map(func, items))
+
+
+def _slot_names(cls):
+    """
+    Yield the (mangled) names of the slots declared by the classes in the MRO of `cls`.
+    """
+    for klass in cls.__mro__:
+        slots = vars(klass).get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            yield name
 
 
 class BaseDict(dict):
@@ -34,8 +50,89 @@ class BaseDict(dict):
     A dictionary that for type lookups, will walk over the Method Resolution Order (MRO) of that
     type, to find the value for the most specific superclass (including the class itself) of that
     type.
+
+    Lookups with a type are cached per dictionary, misses included. Every method that mutates
+    the dictionary clears that cache, and increments a version. A lookup that runs concurrently
+    with a mutation does not keep its result in the cache if the version changed meanwhile, such
+    that a resolution from before the mutation is never cached after it.
+
+    Unlike its subclasses, this class does not declare `__slots__`: the cache is stored in the
+    `__dict__` of the instance, such that the layout of the instances remains the one of a
+    `dict` subclass, and the dictionary classes can still be combined with other subclasses of
+    `dict`, like `OrderedDict` and `defaultdict`.
+
+    The cache has two limitations: it holds the looked up types, and thus keeps these alive,
+    until the dictionary is mutated or deleted, and it does not notice that the `__bases__` of a
+    class are reassigned: such change is only taken into account after the next mutation.
     """
 
+    # True if __getitem__ is the one of BaseDict, such that get and setdefault can use _resolve
+    _plain_getitem = True
+    # True if the key setdefault writes to is always the first candidate of a lookup
+    _exact_first = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Determine for the subclass if it overrides `__getitem__`: if so, `get` and `setdefault`
+        keep delegating to it.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._plain_getitem = cls.__getitem__ is BaseDict.__getitem__
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the dictionary like a `dict`, and start with an empty lookup cache.
+        """
+        super().__init__(*args, **kwargs)
+        self._mro_cache = {}
+        self._version = 0
+
+    def __getattr__(self, name):
+        """
+        Create the lookup cache (and its version) if it does not exist yet. This is the case if
+        the dictionary was not created through `BaseDict.__init__`, for example when it is
+        unpickled, or when the `__init__` of a subclass does not call it.
+        """
+        if name == "_mro_cache":
+            cache = self._mro_cache = {}
+            return cache
+        if name == "_version":
+            self._version = 0
+            return 0
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __getstate__(self):
+        """
+        Return the state to pickle or copy: the attributes and the slot values of a subclass (if
+        any), but not the lookup cache, which is rebuilt empty.
+        """
+        excluded = ("_mro_cache", "_version", "__dict__", "__weakref__")
+        state = {
+            name: value for name, value in vars(self).items() if name not in excluded
+        }
+        slots = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if name not in excluded and hasattr(self, name)
+        }
+        return state, slots
+
+    def __setstate__(self, state):
+        """
+        Restore the attributes and the slot values of a subclass, as returned by `__getstate__`.
+        A single dictionary of attributes, as pickled by earlier versions, is accepted as well.
+        """
+        slots = None
+        if isinstance(state, tuple):
+            state, slots = state
+        if state:
+            vars(self).update(state)
+        if slots:
+            for name, value in slots.items():
+                setattr(self, name, value)
+
     def _get_keys(self, key) -> Iterable[object]:
         """
         Return an iterable of candidate lookup keys for dictionary lookup.
@@ -63,18 +160,73 @@ class BaseDict(dict):
         """
         return key
 
-    def __getitem__(self, key):
+    def _lookup(self, key):
         """
-        Return the value mapped to `key` by trying candidate lookup keys produced by `_get_keys`.
+        Return the value mapped to `key`, or the `MISSING` sentinel if there is no such value.
+
+        For type keys, the result (including a miss) is cached, such that the next lookup for that
+        type only needs a single dictionary probe. `__getitem__`, `get` and `setdefault` probe that
+        cache first through `_resolve`, and only call `_lookup` on a cache miss.
+        """
+        if isinstance(key, type):
+            return self._cached_find(key)
+        return self._find(key)
+
+    def _cached_find(self, key):
+        """
+        Return the value mapped to `key` from the lookup cache, or find it and store it there.
+
+        If the dictionary is mutated while the value is found, the result is removed from the
+        cache again, since it might be based on the items before the mutation.
+        """
+        cache = self._mro_cache
+        result = cache.get(key, UNCACHED)
+        if result is UNCACHED:
+            version = self._version
+            result = cache[key] = self._find(key)
+            if self._version != version:
+                cache.pop(key, None)
+        return result
+
+    def _find(self, key):
+        """
+        Return the value mapped to `key`, or the `MISSING` sentinel if there is no such value.
 
         This performs lookups in the order produced by `self._get_keys(key)` and returns the first
-        mapped value found. If no candidate is present in the mapping a `KeyError` is raised.
+        mapped value found. Misses are signalled with a sentinel, and not with an exception, since
+        raising and catching a `KeyError` for every miss is considerably more expensive.
         """
+        d_get = dict.get
         for item in self._get_keys(key):
-            result = super().get(item, MISSING)
+            result = d_get(self, item, MISSING)
             if result is not MISSING:
                 return result
-        raise KeyError(key)
+        return MISSING
+
+    def _resolve(self, key):
+        """
+        Return the value mapped to `key` from the lookup cache if it is there, and otherwise
+        through `_lookup`; a miss is returned as the `MISSING` sentinel.
+        """
+        try:
+            result = self._mro_cache.get(key, UNCACHED)
+        except TypeError:  # unhashable keys, like a tuple with a list, are never cached
+            return self._lookup(key)
+        if result is UNCACHED:
+            return self._lookup(key)
+        return result
+
+    def __getitem__(self, key):
+        """
+        Return the value mapped to `key` by trying candidate lookup keys produced by `_get_keys`.
+
+        This performs lookups in the order produced by `self._get_keys(key)` and returns the first
+        mapped value found. If no candidate is present in the mapping a `KeyError` is raised.
+        """
+        result = self._resolve(key)
+        if result is MISSING:
+            raise KeyError(key)
+        return result
 
     def get(self, key, default=None):
         """
@@ -83,7 +235,15 @@ class BaseDict(dict):
         If `key` is a type, the lookup walks the type's MRO (including the type itself) and returns
         the first matching value; for non-type keys a direct lookup is attempted. If no candidate
         is found, `default` is returned.
+
+        Unless a subclass overrides `__getitem__`, this uses `_resolve` directly, such that a miss
+        does not raise and catch a `KeyError`.
         """
+        if self._plain_getitem:
+            result = self._resolve(key)
+            if result is MISSING:
+                return default
+            return result
         try:
             return self[key]
         except KeyError:
@@ -98,6 +258,10 @@ class BaseDict(dict):
         found, `default` is stored under the exact `key` provided (no MRO walking when writing)
         and `default` is returned.
 
+        If the key under which `default` would be stored is always the first candidate of the
+        lookup (see `_exact_first`), that key is probed first: if it is present, its value is
+        returned without walking the MRO (or filling the lookup cache).
+
         Parameters:
             key: The lookup key (may be a type; type keys are resolved via MRO on read).
             default: Value to insert and return if no existing mapping is found.
@@ -105,11 +269,121 @@ class BaseDict(dict):
         Returns:
             The existing mapped value (found via lookup) or `default` after insertion.
         """
-        try:
-            return self[key]
-        except KeyError:
+        if self._exact_first:
+            result = dict.get(self, key, MISSING)
+            if result is not MISSING:
+                return result
+        if self._plain_getitem:
+            result = self._resolve(key)
+        else:
+            try:
+                result = self[key]
+            except KeyError:
+                result = MISSING
+        if result is MISSING:
             self[self._set_key(key)] = default
             return default
+        return result
+
+    def precompute(self, *types):
+        """
+        Resolve the given types up front, and store the results in the lookup cache.
+
+        This is useful for dictionaries that are constructed once and queried many times with a
+        known set of types: the MRO walks then happen at startup, and not at the first lookup.
+        Mutating the dictionary afterwards clears the cache again.
+
+        Parameters:
+            *types: The types to resolve; these do not need to be keys of the dictionary.
+        """
+        for key in types:
+            self._lookup(key)
+
+    def freeze(self, subclasses: Iterable[type]) -> "FrozenInheritanceDict":
+        """
+        Return a snapshot of the dictionary, where the given types are resolved in advance.
+
+        The result contains the items of this dictionary, together with an item for each of the
+        `subclasses` that has a value, by the lookup rules of this dictionary. For a closed set of
+        types, a lookup is then a single (plain) dictionary lookup. Later changes to this
+        dictionary are not reflected in the snapshot.
+
+        Parameters:
+            subclasses: The types to resolve.
+
+        Returns:
+            FrozenInheritanceDict: A dictionary with the original and the resolved items.
+        """
+        resolved = FrozenInheritanceDict(self)
+        for key in subclasses:
+            result = self._lookup(key)
+            if result is not MISSING:
+                resolved[key] = result
+        return resolved
+
+    def _invalidate(self):
+        """
+        Clear everything that was derived from the items of the dictionary, like the lookup
+        cache, and increment the version. This is called by every method that mutates the
+        dictionary, after the mutation.
+        """
+        self._version += 1
+        self._mro_cache.clear()
+
+    def __setitem__(self, key, value):
+        """
+        Set `key` to `value`, and clear the lookup cache.
+        """
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        """
+        Remove `key`, and clear the lookup cache.
+        """
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other):
+        """
+        Update the dictionary in place with `other`, and clear the lookup cache.
+        """
+        try:
+            return super().__ior__(other)
+        finally:  # the items before a failing item were already added
+            self._invalidate()
+
+    def clear(self):
+        """
+        Remove all items, and clear the lookup cache.
+        """
+        super().clear()
+        self._invalidate()
+
+    def pop(self, *args):
+        """
+        Remove the exact `key` and return its value, and clear the lookup cache.
+        """
+        result = super().pop(*args)
+        self._invalidate()
+        return result
+
+    def popitem(self):
+        """
+        Remove and return the last inserted item, and clear the lookup cache.
+        """
+        result = super().popitem()
+        self._invalidate()
+        return result
+
+    def update(self, *args, **kwargs):
+        """
+        Update the dictionary like `dict.update`, and clear the lookup cache.
+        """
+        try:
+            super().update(*args, **kwargs)
+        finally:  # the items before a failing item were already added
+            self._invalidate()
 
     def __repr__(self):
         """
@@ -136,6 +410,20 @@ class FallbackMixin:  # pylint: disable=too-few-public-methods
     none result in a hit.
     """
 
+    __slots__ = ()
+
+    def _lookup(self, key):
+        """
+        Return the value mapped to `key`, or the `MISSING` sentinel if there is no such value.
+
+        Besides types, tuples that only contain types are cached as well, such that the next
+        lookup with the same tuple only needs a single dictionary probe, and does not expand
+        the tuple again.
+        """
+        if isinstance(key, tuple) and all(isinstance(item, type) for item in key):
+            return self._cached_find(key)
+        return super()._lookup(key)
+
     def _get_keys(self, key) -> Iterable[object]:
         """
         Return an iterable of candidate lookup keys, expanding tuple keys by concatenating
@@ -174,6 +462,44 @@ class InheritanceDict(BaseDict):
     resolution order of the type, until a superclass is a hit.
     """
 
+    __slots__ = ()
+
+    # True if the _get_keys after InheritanceDict in the MRO is the identity of BaseDict
+    _mro_only = True
+    # True if furthermore the _get_keys of the class is _inline_get_keys
+    _inline_keys = True
+    # True if furthermore _set_key and __getitem__ are the ones of BaseDict
+    _exact_first = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Determine for the subclass if the classes of the MRO of a type can be used as lookup
+        keys as they are, or if these need to pass through the next `_get_keys` in the MRO.
+
+        If the subclass does not alter the candidate keys of the class that defines
+        `_inline_get_keys`, `_find` can determine the candidates of a non-type key itself,
+        without dispatching through the `_get_keys` chain.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._mro_only = super(InheritanceDict, cls)._get_keys is BaseDict._get_keys
+        cls._inline_keys = cls._mro_only and cls._get_keys is cls._inline_get_keys
+        cls._exact_first = (
+            cls._inline_keys
+            and cls._set_key is BaseDict._set_key
+            and cls._plain_getitem
+        )
+
+    def _find(self, key):
+        """
+        Return the value mapped to `key`, or the `MISSING` sentinel if there is no such value.
+
+        If the candidate keys are not altered by a subclass or mixin (see `_inline_keys`), the
+        only candidate for a non-type key is the key itself, and it is looked up directly.
+        """
+        if self._inline_keys and not isinstance(key, type):
+            return dict.get(self, key, MISSING)
+        return super()._find(key)
+
     def _get_keys(self, key) -> Iterable[object]:
         """
         Yield lookup candidate keys.
@@ -181,11 +507,25 @@ class InheritanceDict(BaseDict):
         If `key` is a type, yields the classes in its method-resolution order (key.__mro__) in
         order; otherwise yields the key itself. Used to produce the sequence of keys to try for
         dictionary lookups that support type-based inheritance resolution.
+
+        If the classes in the MRO do not need any further expansion (see `_mro_only`), the MRO
+        tuple is returned as is, without wrapping it in a generator. If furthermore the dictionary
+        has fewer items than the MRO, the (C-level) intersection of the keys with the MRO is
+        determined instead, and only the most specific hit is returned.
         """
         if isinstance(key, type):
-            return concat_map(super()._get_keys, key.__mro__)
+            mro = key.__mro__
+            if not self._mro_only:
+                return concat_map(super()._get_keys, mro)
+            if len(self) < len(mro):
+                found = self.keys() & mro
+                return (min(found, key=mro.index),) if found else ()
+            return mro
         return super()._get_keys(key)
 
+    # the _get_keys for which the candidates of a non-type key are known to _find
+    _inline_get_keys = _get_keys
+
 
 class FallbackInheritanceDict(FallbackMixin, BaseDict):
     """
@@ -193,6 +533,8 @@ class FallbackInheritanceDict(FallbackMixin, BaseDict):
     result in extra lookups like MRO for type lookups.
     """
 
+    __slots__ = ()
+
 
 class TypeConvertingInheritanceDict(InheritanceDict):
     """
@@ -200,24 +542,46 @@ class TypeConvertingInheritanceDict(InheritanceDict):
     retries the lookup using the key's type and resolves via that type's MRO.
     """
 
-    def _get_keys(self, key):
+    __slots__ = ()
+
+    def _find(self, key):
+        """
+        Return the value mapped to `key`, or the `MISSING` sentinel if there is no such value.
+
+        If the candidate keys are not altered by a subclass or mixin (see `_inline_keys`), and
+        `key` is not a type and has no mapping itself, the lookup is retried with the type of
+        `key`. That retry goes through `_lookup`, such that the resolution of the type is cached,
+        and lookups with other objects of the same type only need a single dictionary probe.
+        Otherwise the candidates of `_get_keys` already include those of the type.
         """
-        Yield candidate lookup keys for a lookup key.
+        if self._inline_keys and not isinstance(key, type):
+            result = dict.get(self, key, MISSING)
+            if result is MISSING:
+                return self._lookup(type(key))
+            return result
+        return super()._find(key)
 
-        Always yields the candidates produced by super()._get_keys(key). If key is not a type,
-        also yields the candidates produced by super()._get_keys(type(key)) so lookups will
-        fall back to the key's type (and its MRO) after the original candidates.
+    def _get_keys(self, key) -> Iterable[object]:
+        """
+        Return candidate lookup keys for a lookup key.
+
+        Always returns the candidates produced by super()._get_keys(key). If key is not a type,
+        these are followed by the candidates produced by super()._get_keys(type(key)) so lookups
+        will fall back to the key's type (and its MRO) after the original candidates.
 
         Parameters:
             key: The lookup key. Non-type keys cause an additional sequence of candidate keys
                  derived from type(key).
 
-        Yields:
-            Candidate keys (types or other lookup keys) in the order they should be tried.
+        Returns:
+            A tuple of candidate keys (types or other lookup keys) in the order they should be
+            tried.
         """
-        yield from super()._get_keys(key)
-        if not isinstance(key, type):
-            yield from super()._get_keys(type(key))
+        if isinstance(key, type):
+            return super()._get_keys(key)
+        return (*super()._get_keys(key), *super()._get_keys(type(key)))
+
+    _inline_get_keys = _get_keys
 
 
 class FallbackTypeConvertingInheritanceDict(FallbackMixin, BaseDict):
@@ -225,3 +589,20 @@ class FallbackTypeConvertingInheritanceDict(FallbackMixin, BaseDict):
     A variant of TypeConvertingInheritanceDict where one can pass a tuple of multple
     keys. The keys are tried one after another, and some keys can trigger MRO lookups.
     """
+
+    __slots__ = ()
+
+
+class FrozenInheritanceDict(dict):
+    """
+    A plain dictionary produced by `BaseDict.freeze`, with the lookups for a closed set of types
+    resolved in advance. Lookups do not walk the MRO, and are thus as fast as for a `dict`.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __repr__(self):
+        """
+        Return a canonical string representation of the mapping, like "FrozenInheritanceDict({})".
+        """
+        return f"{type(self).__name__}({dict.__repr__(self)})"
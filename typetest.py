@@ -1,8 +1,18 @@
+import copy
+from collections import OrderedDict, defaultdict
+import gc
+import pickle
 import unittest
+import weakref
 from datetime import date, datetime, time, timedelta
 
 from inheritance_dict import (
+    MISSING,
+    BaseDict,
     FallbackInheritanceDict,
+    FallbackMixin,
+    FallbackTypeConvertingInheritanceDict,
+    FrozenInheritanceDict,
     InheritanceDict,
     TypeConvertingInheritanceDict,
 )
@@ -12,6 +22,74 @@ class A(str):
     pass
 
 
+class B(A):
+    pass
+
+
+class C(B):
+    pass
+
+
+class NameMixin:
+    def _get_keys(self, key):
+        return (*super()._get_keys(key), getattr(key, "__name__", key))
+
+
+class NameInheritanceDict(InheritanceDict, NameMixin, BaseDict):
+    pass
+
+
+class FallbackTypeConvertingDict(FallbackMixin, TypeConvertingInheritanceDict):
+    pass
+
+
+class DefaultTypeConvertingDict(TypeConvertingInheritanceDict):
+    def _get_keys(self, key):
+        return (*super()._get_keys(key), "default")
+
+
+class LowerInheritanceDict(InheritanceDict):
+    def _set_key(self, key):
+        return key.lower() if isinstance(key, str) else key
+
+
+class MagicInheritanceDict(InheritanceDict):
+    def __getitem__(self, key):
+        if key == "magic":
+            return 42
+        return super().__getitem__(key)
+
+
+class AttributeInheritanceDict(InheritanceDict):
+    def __init__(self, data, name):
+        dict.__init__(self, data)
+        self.name = name
+
+
+class LabelInheritanceDict(AttributeInheritanceDict):
+    __slots__ = "__label"
+
+    def __init__(self, data, name, label):
+        super().__init__(data, name)
+        self.__label = label
+
+    @property
+    def label(self):
+        return self.__label
+
+
+class SlotsInheritanceDict(LabelInheritanceDict):
+    __slots__ = ("unset",)
+
+
+class MutatingInheritanceDict(InheritanceDict):
+    def _find(self, key):
+        result = super()._find(key)
+        if key is bool:
+            self[int] = 5
+        return result
+
+
 class TypeTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -92,6 +170,27 @@ class TypeTest(unittest.TestCase):
         self.assertEqual(3, self.inheritance_dict3.get((str, complex)))
         self.assertEqual(4, self.inheritance_dict3.get(("a", int)))
 
+    def test_fallback_unhashable(self):
+        fallback_dict = FallbackInheritanceDict({int: 1})
+        self.assertEqual(1, fallback_dict[int, []])
+        self.assertEqual(1, fallback_dict.get((int, [])))
+        self.assertEqual(1, fallback_dict.setdefault((int, []), 2))
+        with self.assertRaises(TypeError):
+            fallback_dict[str, []]
+        self.assertEqual({}, fallback_dict._mro_cache)
+
+    def test_fallback_cache(self):
+        fallback_dict = FallbackInheritanceDict({int: 2, str: 3, "a": 4})
+        self.assertEqual(3, fallback_dict[complex, str])
+        self.assertEqual(4, fallback_dict["a", int])
+        self.assertIsNone(fallback_dict.get((complex, float)))
+        self.assertEqual(
+            {(complex, str): 3, (complex, float): MISSING}, fallback_dict._mro_cache
+        )
+        fallback_dict[complex] = 5
+        self.assertEqual(5, fallback_dict[complex, str])
+        self.assertEqual(5, fallback_dict[complex, float])
+
     def test_mro_walk(self):
         """
         Verify that lookups follow Python's method resolution order (MRO) across both
@@ -125,6 +224,27 @@ class TypeTest(unittest.TestCase):
         self.assertEqual(2, self.type_converting_inheritance_dict2.get(bool))
         self.assertEqual(3, self.type_converting_inheritance_dict2.get(A))
 
+    def test_mro_walk_small_dict(self):
+        self.assertEqual(1, InheritanceDict({object: 1})[C])
+        self.assertEqual(2, InheritanceDict({object: 1, str: 2})[C])
+        self.assertEqual(3, InheritanceDict({A: 3, str: 2})[C])
+        self.assertEqual(4, InheritanceDict({A: 3, C: 4})[C])
+        with self.assertRaises(KeyError):
+            InheritanceDict({int: 2})[C]
+
+    def test_mro_walk_get_keys_mixin(self):
+        self.assertTrue(TypeConvertingInheritanceDict._mro_only)
+        self.assertTrue(TypeConvertingInheritanceDict._inline_keys)
+        self.assertFalse(NameInheritanceDict._mro_only)
+        self.assertFalse(NameInheritanceDict._inline_keys)
+        self.assertEqual(2, NameInheritanceDict({"int": 2})[bool])
+        self.assertEqual(3, NameInheritanceDict({"int": 2, bool: 3})[bool])
+        self.assertEqual(4, NameInheritanceDict({"a": 4})["a"])
+        self.assertEqual(5, InheritanceDict({"a": 5})["a"])
+        self.assertEqual(6, InheritanceDict({int: 6}).get(3, 6))
+        with self.assertRaises(KeyError):
+            NameInheritanceDict({"int": 2})[str]
+
     def test_missing_key(self):
         """
         Test handling of missing keys for InheritanceDict and TypeConvertingInheritanceDict.
@@ -211,6 +331,245 @@ class TypeTest(unittest.TestCase):
         self.assertEqual(6, self.inheritance_dict3.setdefault(float, 7))
         self.assertEqual(8, self.inheritance_dict3.setdefault(complex, 8))
 
+    def test_setdefault_exact_key(self):
+        inheritance_dict = InheritanceDict({object: 1, int: 2})
+        self.assertEqual(2, inheritance_dict.setdefault(int, 5))
+        self.assertEqual({}, inheritance_dict._mro_cache)
+        self.assertEqual(2, inheritance_dict.setdefault(bool, 5))
+        self.assertEqual({bool: 2}, inheritance_dict._mro_cache)
+        fallback_dict = FallbackInheritanceDict({int: 2})
+        self.assertEqual(2, fallback_dict.setdefault((int, str), 5))
+        self.assertFalse(FallbackInheritanceDict._exact_first)
+        self.assertFalse(NameInheritanceDict._exact_first)
+        self.assertTrue(TypeConvertingInheritanceDict._exact_first)
+        self.assertFalse(LowerInheritanceDict._exact_first)
+        self.assertFalse(MagicInheritanceDict._exact_first)
+        lower_dict = LowerInheritanceDict({"a": 1})
+        self.assertEqual(1, lower_dict.setdefault("a", 5))
+        self.assertEqual(5, lower_dict.setdefault("A", 5))
+        self.assertEqual({"a": 5}, lower_dict)
+
+    def test_overridden_getitem(self):
+        magic_dict = MagicInheritanceDict({int: 2})
+        self.assertFalse(MagicInheritanceDict._plain_getitem)
+        self.assertEqual(42, magic_dict["magic"])
+        self.assertEqual(42, magic_dict.get("magic"))
+        self.assertEqual(2, magic_dict.get(bool))
+        self.assertEqual(5, magic_dict.get(str, 5))
+        self.assertEqual(42, magic_dict.setdefault("magic", 5))
+        self.assertEqual(2, magic_dict.setdefault(bool, 5))
+        self.assertEqual(6, magic_dict.setdefault(str, 6))
+        self.assertEqual({int: 2, str: 6}, magic_dict)
+
+    def test_cache_invalidation(self):
+        inheritance_dict = InheritanceDict({object: 1})
+        self.assertEqual(1, inheritance_dict[bool])
+        inheritance_dict[int] = 2
+        self.assertEqual(2, inheritance_dict[bool])
+        inheritance_dict.update({bool: 3})
+        self.assertEqual(3, inheritance_dict[bool])
+        del inheritance_dict[bool]
+        self.assertEqual(2, inheritance_dict[bool])
+        self.assertEqual(2, inheritance_dict.pop(int))
+        self.assertEqual(1, inheritance_dict[bool])
+        inheritance_dict |= {int: 4}
+        self.assertEqual(4, inheritance_dict[bool])
+        self.assertEqual((int, 4), inheritance_dict.popitem())
+        self.assertEqual(1, inheritance_dict[bool])
+        inheritance_dict.clear()
+        self.assertIsNone(inheritance_dict.get(bool))
+        inheritance_dict.setdefault(int, 5)
+        self.assertEqual(5, inheritance_dict[bool])
+
+    def test_precompute(self):
+        inheritance_dict = InheritanceDict({object: 1, int: 2})
+        inheritance_dict.precompute(bool, C, int)
+        self.assertEqual({bool: 2, C: 1, int: 2}, inheritance_dict._mro_cache)
+        self.assertEqual(2, inheritance_dict[bool])
+        self.assertEqual(1, inheritance_dict[C])
+        inheritance_dict[str] = 3
+        self.assertEqual({}, inheritance_dict._mro_cache)
+        self.assertEqual(3, inheritance_dict[C])
+
+    def test_cache_concurrent_mutation(self):
+        inheritance_dict = MutatingInheritanceDict({object: 1, int: 2})
+        self.assertEqual(2, inheritance_dict[bool])
+        self.assertEqual({}, inheritance_dict._mro_cache)
+        self.assertEqual(5, inheritance_dict[bool])
+
+    def test_cache_failing_update(self):
+        inheritance_dict = InheritanceDict({object: 1})
+        self.assertEqual(1, inheritance_dict[bool])
+        with self.assertRaises(ValueError):
+            inheritance_dict.update([(int, 2), (str,)])
+        self.assertEqual(2, inheritance_dict[bool])
+        with self.assertRaises(ValueError):
+            inheritance_dict |= [(bool, 3), (str,)]
+        self.assertEqual(3, inheritance_dict[bool])
+
+    def test_cache_limitations(self):
+        class Base:
+            pass
+
+        class Other:
+            pass
+
+        class Child(Base):
+            pass
+
+        inheritance_dict = InheritanceDict({Base: 1, Other: 2})
+        self.assertEqual(1, inheritance_dict[Child])
+        Child.__bases__ = (Other,)
+        self.assertEqual(1, inheritance_dict[Child])
+        inheritance_dict[int] = 3
+        self.assertEqual(2, inheritance_dict[Child])
+        reference = weakref.ref(type("Dynamic", (Base,), {}))
+        self.assertEqual(1, inheritance_dict[reference()])
+        gc.collect()
+        self.assertIsNotNone(reference())
+        inheritance_dict[int] = 4
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_type_converting_cache(self):
+        type_converting_inheritance_dict = TypeConvertingInheritanceDict(
+            {object: 1, int: 2, "a": 4}
+        )
+        self.assertEqual(4, type_converting_inheritance_dict["a"])
+        self.assertEqual({}, type_converting_inheritance_dict._mro_cache)
+        self.assertEqual(2, type_converting_inheritance_dict[True])
+        self.assertEqual(1, type_converting_inheritance_dict["b"])
+        self.assertEqual({bool: 2, str: 1}, type_converting_inheritance_dict._mro_cache)
+        type_converting_inheritance_dict[str] = 3
+        self.assertEqual(3, type_converting_inheritance_dict["b"])
+
+    def test_freeze(self):
+        frozen = TypeConvertingInheritanceDict({int: 2, str: 3, "a": 4}).freeze(
+            [bool, A, C, complex]
+        )
+        self.assertIs(FrozenInheritanceDict, type(frozen))
+        self.assertEqual(
+            {int: 2, str: 3, "a": 4, bool: 2, A: 3, C: 3},
+            {key: frozen[key] for key in (int, str, "a", bool, A, C)},
+        )
+        self.assertNotIn(complex, frozen)
+        self.assertNotIn(B, frozen)
+        self.assertEqual(
+            "FrozenInheritanceDict({int: 1})",
+            repr(InheritanceDict({int: 1}).freeze([])).replace("<class 'int'>", "int"),
+        )
+
+    def test_type_converting_get_keys(self):
+        self.assertTrue(TypeConvertingInheritanceDict._inline_keys)
+        self.assertFalse(FallbackTypeConvertingDict._inline_keys)
+        self.assertFalse(DefaultTypeConvertingDict._inline_keys)
+        self.assertEqual(1, FallbackTypeConvertingDict({int: 1})["a", 5])
+        self.assertEqual(2, FallbackTypeConvertingDict({str: 2})[5, "a"])
+        self.assertEqual(2, FallbackTypeConvertingDict({str: 2})[bool, A])
+        with self.assertRaises(KeyError):
+            FallbackTypeConvertingDict({str: 2})[5, 1j]
+        self.assertEqual(1, DefaultTypeConvertingDict({int: 1, "default": 9})[3])
+        self.assertEqual(9, DefaultTypeConvertingDict({int: 1, "default": 9})[1j])
+
+    def test_copy(self):
+        inheritance_dict = TypeConvertingInheritanceDict({object: 1, int: 2})
+        self.assertEqual(2, inheritance_dict[bool])
+        for duplicate in (
+            copy.copy(inheritance_dict),
+            copy.deepcopy(inheritance_dict),
+            pickle.loads(pickle.dumps(inheritance_dict)),
+        ):
+            self.assertIs(TypeConvertingInheritanceDict, type(duplicate))
+            self.assertEqual(inheritance_dict, duplicate)
+            duplicate[bool] = 3
+            self.assertEqual(3, duplicate[bool])
+            self.assertEqual(2, inheritance_dict[bool])
+
+    def test_copy_protocols(self):
+        inheritance_dict = InheritanceDict({object: 1, int: 2})
+        self.assertEqual(2, inheritance_dict[bool])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            duplicate = pickle.loads(pickle.dumps(inheritance_dict, protocol))
+            self.assertIs(InheritanceDict, type(duplicate))
+            self.assertEqual(inheritance_dict, duplicate)
+            duplicate[bool] = 3
+            self.assertEqual(3, duplicate[bool])
+
+    def test_copy_subclass_state(self):
+        inheritance_dict = AttributeInheritanceDict({object: 1, int: 2}, "name")
+        self.assertEqual(2, inheritance_dict[bool])
+        for duplicate in (
+            copy.copy(inheritance_dict),
+            pickle.loads(pickle.dumps(inheritance_dict)),
+        ):
+            self.assertIs(AttributeInheritanceDict, type(duplicate))
+            self.assertEqual("name", duplicate.name)
+            self.assertEqual({object: 1, int: 2}, duplicate)
+            self.assertEqual({}, duplicate._mro_cache)
+            self.assertEqual(2, duplicate[bool])
+        with self.assertRaises(AttributeError):
+            inheritance_dict.missing
+
+    def test_copy_subclass_slots(self):
+        inheritance_dict = SlotsInheritanceDict({object: 1, int: 2}, "name", "label")
+        self.assertEqual(2, inheritance_dict[bool])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            duplicate = pickle.loads(pickle.dumps(inheritance_dict, protocol))
+            self.assertIs(SlotsInheritanceDict, type(duplicate))
+            self.assertEqual("name", duplicate.name)
+            self.assertEqual("label", duplicate.label)
+            self.assertFalse(hasattr(duplicate, "unset"))
+            self.assertEqual({object: 1, int: 2}, duplicate)
+            self.assertEqual({}, duplicate._mro_cache)
+            self.assertEqual(2, duplicate[bool])
+        duplicate = copy.copy(inheritance_dict)
+        self.assertEqual("label", duplicate.label)
+
+    def test_unpickle_without_cache(self):
+        inheritance_dict = pickle.loads(
+            b"\x80\x04\x95H\x00\x00\x00\x00\x00\x00\x00\x8c\x10inheritance_dict\x94"
+            b"\x8c\x0fInheritanceDict\x94\x93\x94)\x81\x94(\x8c\x08builtins\x94\x8c\x03int"
+            b"\x94\x93\x94K\x01\x8c\x01a\x94K\x02u."
+        )
+        self.assertEqual({int: 1, "a": 2}, inheritance_dict)
+        self.assertEqual(1, inheritance_dict[bool])
+        inheritance_dict = AttributeInheritanceDict({}, "old")
+        inheritance_dict.__setstate__({"name": "name"})
+        self.assertEqual("name", inheritance_dict.name)
+
+    def test_slots(self):
+        for cls in (
+            InheritanceDict,
+            FallbackInheritanceDict,
+            TypeConvertingInheritanceDict,
+            FallbackTypeConvertingInheritanceDict,
+        ):
+            self.assertEqual((), vars(cls)["__slots__"])
+            instance = cls({int: 2})
+            self.assertIs(instance, weakref.ref(instance)())
+        frozen = FrozenInheritanceDict({int: 2})
+        self.assertFalse(hasattr(frozen, "__dict__"))
+        self.assertIs(frozen, weakref.ref(frozen)())
+
+    def test_dict_subclass_mixin(self):
+        class DefaultInheritanceDict(InheritanceDict, defaultdict):
+            pass
+
+        class OrderedInheritanceDict(InheritanceDict, OrderedDict):
+            pass
+
+        default_dict = DefaultInheritanceDict(list, {int: 2})
+        self.assertIs(list, default_dict.default_factory)
+        self.assertEqual(2, default_dict[bool])
+        default_dict[bool] = 3
+        self.assertEqual(3, default_dict[bool])
+        ordered_dict = OrderedInheritanceDict({int: 2, str: 3})
+        ordered_dict.move_to_end(int)
+        self.assertEqual([str, int], list(ordered_dict))
+        self.assertEqual(2, ordered_dict[bool])
+        ordered_dict[bool] = 4
+        self.assertEqual(4, ordered_dict[bool])
+
     def test_repr(self):
         self.assertEqual("InheritanceDict({})", repr(InheritanceDict({})))
         self.assertEqual(